@@ -0,0 +1,42 @@
+"""add_trgm_indexes_for_commodity_matching
+
+Revision ID: c4f7a2d91e03
+Revises: d2b6b2a7c9d1
+Create Date: 2026-08-31 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4f7a2d91e03'
+down_revision: Union[str, Sequence[str], None] = 'd2b6b2a7c9d1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add trigram indexes for server-side fuzzy commodity matching.
+
+    The pg_trgm extension is already enabled (97a23076c0d9). GiST trigram
+    indexes support both the similarity operators (%%) and the distance
+    operator (<->) used for KNN-style "top N closest names" queries, so the
+    interactive commodity mapper can rank candidates in Postgres instead of
+    pulling every row to Python.
+    """
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_usda_commodity_name_trgm "
+        "ON usda_commodity USING gist (lower(name) gist_trgm_ops)"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_resource_name_trgm "
+        "ON resource USING gist (lower(name) gist_trgm_ops)"
+    )
+
+
+def downgrade() -> None:
+    """Drop the trigram indexes."""
+    op.execute("DROP INDEX IF EXISTS ix_resource_name_trgm")
+    op.execute("DROP INDEX IF EXISTS ix_usda_commodity_name_trgm")
@@ -0,0 +1,55 @@
+"""add_usda_record_unique_constraints
+
+Revision ID: e1b3c5d7f902
+Revises: c4f7a2d91e03
+Create Date: 2026-08-31 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e1b3c5d7f902'
+down_revision: Union[str, Sequence[str], None] = 'c4f7a2d91e03'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Natural keys used by the USDA load task's dedup logic. Data-driven so new
+# record tables only need one more tuple here, not another copy-pasted block.
+UNIQUE_CONSTRAINTS = [
+    ('usda_census_record', 'uq_usda_census_record_geoid_year_commodity',
+     'geoid, year, commodity_code'),
+    ('usda_survey_record', 'uq_usda_survey_record_geoid_year_commodity',
+     'geoid, year, commodity_code'),
+]
+
+
+def upgrade() -> None:
+    """Add unique constraints backing the USDA load dedup keys.
+
+    Build the unique index first, then attach it with ADD CONSTRAINT ...
+    USING INDEX — this avoids the implicit full-table uniqueness scan that
+    a plain ADD CONSTRAINT UNIQUE performs under AccessExclusiveLock.
+
+    Both steps are idempotent (IF NOT EXISTS / pg_constraint probe) so a
+    partially-failed run can simply be re-run without manual cleanup or
+    redoing the index build.
+    """
+    for table, name, cols in UNIQUE_CONSTRAINTS:
+        op.execute(f"CREATE UNIQUE INDEX IF NOT EXISTS {name} ON {table} ({cols})")
+        op.execute(f"""
+            DO $$ BEGIN
+                IF NOT EXISTS (SELECT 1 FROM pg_constraint WHERE conname = '{name}') THEN
+                    EXECUTE 'ALTER TABLE {table} ADD CONSTRAINT {name} UNIQUE USING INDEX {name}';
+                END IF;
+            END $$;
+        """)
+
+
+def downgrade() -> None:
+    """Drop the USDA record unique constraints (index is dropped with them)."""
+    for table, name, _cols in UNIQUE_CONSTRAINTS:
+        op.execute(f"ALTER TABLE {table} DROP CONSTRAINT IF EXISTS {name}")
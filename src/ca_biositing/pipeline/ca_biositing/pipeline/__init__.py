@@ -6,6 +6,11 @@ for processing bioeconomy data for the CA Biositing project.
 
 from __future__ import annotations
 
-from ca_biositing.pipeline._version import __version__
+try:
+    from ca_biositing.pipeline._version import __version__
+except ImportError:
+    # _version.py is generated at build/install time (hatch vcs
+    # versioning); a plain source checkout doesn't have it.
+    __version__ = "0.0.0"
 
 __all__ = ["__version__"]
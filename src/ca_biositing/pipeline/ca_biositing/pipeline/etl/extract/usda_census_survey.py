@@ -12,6 +12,7 @@ For more information: https://quickstats.nass.usda.gov/api
 """
 
 from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
 import os
 import pandas as pd
 from prefect import task, get_run_logger
@@ -78,14 +79,15 @@ def extract() -> Optional[pd.DataFrame]:
 
     logger.info(f"Extracting USDA data for {len(commodity_ids)} commodities in {len(PRIORITY_COUNTIES)} priority counties...")
 
-    # Collect data for all priority counties
-    all_dfs = []
+    # Collect data for all priority counties. The per-county requests are
+    # independent, so they run on a small thread pool and the round-trip
+    # latencies overlap instead of summing; results come back in county
+    # order so downstream output is unchanged.
+    counties = sorted(PRIORITY_COUNTIES)
 
-    for county_code in sorted(PRIORITY_COUNTIES):
+    def _fetch_county(county_code):
         logger.info(f"  Querying county {county_code}...")
-
-        # Call utility with commodity names and county filter
-        county_df = usda_nass_to_df(
+        return usda_nass_to_df(
             api_key=USDA_API_KEY,
             state=STATE,
             year=YEAR,
@@ -93,6 +95,11 @@ def extract() -> Optional[pd.DataFrame]:
             county_code=county_code  # Limit to this county
         )
 
+    with ThreadPoolExecutor(max_workers=len(counties)) as pool:
+        county_dfs = list(pool.map(_fetch_county, counties))
+
+    all_dfs = []
+    for county_code, county_df in zip(counties, county_dfs):
         if county_df is not None and not county_df.empty:
             all_dfs.append(county_df)
             logger.info(f"    Got {len(county_df)} records from county {county_code}")
@@ -129,7 +136,10 @@ def extract() -> Optional[pd.DataFrame]:
             logger.info(f"  {comm}: {count} records")
 
         if 'short_desc' in raw_df.columns:
-            statistics = raw_df['short_desc'].str.extract(r'- (\w+(?:\s+\w+)?)\s*$')[0].unique()
+            # Named group: Arrow-backed string columns only support named
+            # groups in str.extract, and it works the same on object dtype.
+            statistics = raw_df['short_desc'].str.extract(
+                r'- (?P<stat>\w+(?:\s+\w+)?)\s*$')['stat'].unique()
             logger.info(f"📈 Statistics types in raw data: {len([s for s in statistics if s])}")
 
     return raw_df
@@ -188,8 +188,11 @@ def transform(
         else:
             logger.info(f"  ❌ No rows found for '{fruit}'")
 
-    # Perform the actual mapping
-    transformed_data['commodity_code'] = transformed_data['commodity'].fillna('').str.upper().map(commodity_map)
+    # Perform the actual mapping. The ASCII map keys are uppercased on the
+    # Arrow-backed string dtype, whose upper kernel is one C loop over the
+    # buffer rather than a per-element Python call with NA checks.
+    transformed_data['commodity_code'] = _as_string(
+        transformed_data['commodity']).fillna('').str.upper().map(commodity_map)
 
     # 🔍 MAPPING RESULTS BY COMMODITY
     commodity_mapping_summary = transformed_data.groupby(['commodity', 'commodity_code']).size().reset_index(name='count')
@@ -231,7 +234,8 @@ def transform(
         status = "✅" if mapped_value != 'NOT_FOUND' else "❌"
         logger.info(f"  {status} '{statistic}' → '{upper_stat}' → {mapped_value} ({count} rows)")
 
-    transformed_data['parameter_id'] = transformed_data['statistic'].fillna('').str.upper().map(parameter_id_map)
+    transformed_data['parameter_id'] = _as_string(
+        transformed_data['statistic']).fillna('').str.upper().map(parameter_id_map)
 
     # 🔍 PARAMETER MAPPING RESULTS
     param_mapping_summary = transformed_data.groupby(['statistic', 'parameter_id']).size().reset_index(name='count')
@@ -256,7 +260,8 @@ def transform(
         status = "✅" if mapped_value != 'NOT_FOUND' else "❌"
         logger.info(f"  {status} '{unit}' → '{upper_unit}' → {mapped_value} ({count} rows)")
 
-    transformed_data['unit_id'] = transformed_data['unit'].fillna('').str.upper().map(unit_id_map)
+    transformed_data['unit_id'] = _as_string(
+        transformed_data['unit']).fillna('').str.upper().map(unit_id_map)
 
     # 🔍 UNIT MAPPING RESULTS
     unit_mapping_summary = transformed_data.groupby(['unit', 'unit_id']).size().reset_index(name='count')
@@ -289,15 +294,27 @@ def transform(
     # 9. Handle coefficient of variation (CV%) if present
     logger.info("🟡 [USDA Transform] Step 8: Processing optional fields...")
     if 'CV (%)' in transformed_data.columns:
-        transformed_data['cv_pct'] = pd.to_numeric(transformed_data['CV (%)'], errors='coerce')
+        cv = transformed_data['CV (%)']
+        transformed_data['cv_pct'] = (
+            cv if pd.api.types.is_numeric_dtype(cv)
+            else pd.to_numeric(cv, errors='coerce')
+        )
     logger.info("  ✓ Optional fields processed")
 
-    # 10. Coerce ID columns to proper integer types
+    # 10. Coerce ID columns to proper integer types. Nullable Int32/Int16
+    # instead of Int64: the values fit comfortably (USDA codes are 8 digits,
+    # years 4), and the narrower columns halve the memory traffic of the
+    # groupbys and zips downstream while still carrying NA.
     logger.info("🟡 [USDA Transform] Step 9: Coercing ID columns...")
+    # Dtype guards make re-coercion a no-op when a column already arrived in
+    # its target dtype (e.g. on a re-run over already-clean data).
     id_columns = ['commodity_code', 'parameter_id', 'unit_id']
     for col in id_columns:
-        if col in transformed_data.columns:
-            transformed_data[col] = pd.to_numeric(transformed_data[col], errors='coerce').astype('Int64')
+        if col in transformed_data.columns and transformed_data[col].dtype != 'Int32':
+            transformed_data[col] = pd.to_numeric(transformed_data[col], errors='coerce').astype('Int32')
+    if 'year' in transformed_data.columns and transformed_data['year'].dtype != 'Int16':
+        transformed_data['year'] = pd.to_numeric(
+            transformed_data['year'], errors='coerce').astype('Int16')
     logger.info("  ✓ ID columns coerced")
 
     # 11. Create note field from components (vectorized)
@@ -380,6 +397,17 @@ def transform(
 
     logger.info("  ✓ Required fields filtering complete")
 
+    # 14. Intern the low-cardinality string columns as categoricals: one
+    # small dictionary plus an integer code per row instead of a PyObject
+    # pointer per cell. Past this point these columns are only compared,
+    # iterated or copied out, never string-mutated, so the cast is safe.
+    logger.info("🟡 [USDA Transform] Step 13: Interning repeated strings...")
+    for col in ('source_type', 'record_type', 'commodity', 'statistic',
+                'unit', 'county', 'survey_period', 'reference_month'):
+        if col in transformed_data.columns:
+            transformed_data[col] = transformed_data[col].astype('category')
+    logger.info("  ✓ Repeated strings interned")
+
     # 🔍 DIAGNOSTIC: Save transformed data for inspection (OPTIONAL - uncomment to enable)
     # Uncomment the following block to generate debug CSV files for troubleshooting
     # try:
@@ -442,45 +470,71 @@ def _build_lookup_maps():
     return commodity_map, parameter_map, unit_map
 
 
+def _as_string(series):
+    """Column → Arrow-backed string dtype when pyarrow is available.
+
+    zfill and concatenation on this dtype run as vectorized UTF-8 kernels
+    over contiguous buffers instead of per-cell object dispatch. Missing
+    values stay missing (the object path used to stringify NaN to 'nan',
+    yielding garbage geoids that survived the required-field filter).
+    """
+    try:
+        return series.astype('string[pyarrow]')
+    except ImportError:
+        return series.astype('string')
+
+
 def _normalize_geoid(df):
     """Construct 5-digit FIPS geoid from state + county codes"""
     df = df.copy()
     state_fips_default = '06'  # California
 
     if 'state_fips_code' in df.columns and 'county_code' in df.columns:
-        df['geoid'] = df['state_fips_code'].astype(str).str.zfill(2) + \
-                      df['county_code'].astype(str).str.zfill(3)
+        df['geoid'] = _as_string(df['state_fips_code']).str.zfill(2) + \
+                      _as_string(df['county_code']).str.zfill(3)
     elif 'county_code' in df.columns:
-        df['geoid'] = state_fips_default + df['county_code'].astype(str).str.zfill(3)
+        df['geoid'] = state_fips_default + _as_string(df['county_code']).str.zfill(3)
     else:
         df['geoid'] = None
+        return df
 
-    df['geoid'] = df['geoid'].astype(str).str.zfill(5)
+    df['geoid'] = df['geoid'].str.zfill(5)
     return df
 
 
+# USDA column → schema column. Fixed for the life of the process, so built
+# once at import instead of per call.
+_COLUMN_MAP = {
+    'commodity_desc': 'commodity',
+    'statisticcat_desc': 'statistic',
+    'unit_desc': 'unit',
+    'Value': 'observation',
+    'county_name': 'county',
+    'year': 'year',
+    'freq_desc': 'survey_period',
+    'reference_period_desc': 'reference_month',
+    'begin_code': 'begin_code',
+    'end_code': 'end_code',
+    'source_desc': 'source_type'
+}
+
+
 def _normalize_columns(df):
     """Rename USDA columns to match schema"""
-    mapping = {
-        'commodity_desc': 'commodity',
-        'statisticcat_desc': 'statistic',
-        'unit_desc': 'unit',
-        'Value': 'observation',
-        'county_name': 'county',
-        'year': 'year',
-        'freq_desc': 'survey_period',
-        'reference_period_desc': 'reference_month',
-        'begin_code': 'begin_code',
-        'end_code': 'end_code',
-        'source_desc': 'source_type'
-    }
-    return df.rename(columns={k: v for k, v in mapping.items() if k in df.columns})
+    # copy=False: the input is already the transform's private copy, so the
+    # rename only has to relabel columns, not duplicate every buffer.
+    return df.rename(
+        columns={k: v for k, v in _COLUMN_MAP.items() if k in df.columns},
+        copy=False)
 
 
 def _clean_strings(df):
-    """Clean string columns: replace empty/whitespace with NaN, then lowercase"""
-    df = df.copy()
+    """Clean string columns: replace empty/whitespace with NaN, then lowercase.
 
+    Mutates the frame in place: transform hands in its own private copy
+    (made in _normalize_geoid), so a second full-frame copy here only
+    doubled peak memory right before the column rewrites.
+    """
     # Replace empty/whitespace-only strings with NaN
     str_cols = ['commodity', 'statistic', 'unit', 'county', 'survey_period', 'reference_month']
     str_cols = [c for c in str_cols if c in df.columns]
@@ -495,8 +549,19 @@ def _clean_strings(df):
 
 def _convert_to_numeric(series):
     """Convert to numeric, handling commas and decimals"""
+    # Already-numeric input needs no string pass at all
+    if pd.api.types.is_numeric_dtype(series):
+        return pd.to_numeric(series, errors='coerce')
+
+    # Prefer the Arrow-backed string dtype: its replace kernel runs over the
+    # UTF-8 buffer without per-cell Python dispatch. Fall back to the pandas
+    # string dtype when pyarrow is unavailable.
+    try:
+        cleaned = series.astype('string[pyarrow]')
+    except ImportError:
+        cleaned = series.astype('string')
     return pd.to_numeric(
-        series.astype(str).str.replace(',', ''),
+        cleaned.str.replace(',', '', regex=False),
         errors='coerce'
     )
 
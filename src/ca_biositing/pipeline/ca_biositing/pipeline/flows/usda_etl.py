@@ -22,6 +22,12 @@ def usda_etl_flow():
     logger.info("USDA ETL Flow Started")
     logger.info("=" * 70)
 
+    # Step 1 (submitted first): Extract is pure API I/O and does not depend
+    # on the lineage ids, so it runs on the task runner while Step 0 writes
+    # the tracking rows — the only two steps here without a data dependency.
+    logger.info("\n[Step 1] Extracting USDA data...")
+    extract_future = extract.submit()
+
     # Step 0: Create lineage tracking
     logger.info("\n[Step 0] Creating lineage tracking...")
     etl_run_id = create_etl_run_record.fn(pipeline_name="USDA ETL")
@@ -31,9 +37,7 @@ def usda_etl_flow():
     )
     logger.info(f"✓ etl_run_id={etl_run_id}, lineage_group_id={lineage_group_id}")
 
-    # Step 1: Extract
-    logger.info("\n[Step 1] Extracting USDA data...")
-    raw_data = extract()
+    raw_data = extract_future.result()
     if raw_data is None:
         logger.error("✗ Extract failed")
         return False
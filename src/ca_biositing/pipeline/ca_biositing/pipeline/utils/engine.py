@@ -1,5 +1,6 @@
 from sqlmodel import create_engine
 import os
+import threading
 
 # This module provides SQLAlchemy engines for the pipeline package.
 # Delegates to ca_biositing.datamodels.config.Settings for URL construction,
@@ -27,12 +28,26 @@ DATABASE_URL = _get_database_url()
 engine = create_engine(DATABASE_URL)
 
 
+_etl_engine = None
+_etl_engine_lock = threading.Lock()
+
+
 def get_engine():
-    """Return a SQLAlchemy engine with connection pool settings for ETL tasks."""
-    return create_engine(
-        _get_database_url(),
-        pool_size=5,
-        max_overflow=0,
-        pool_pre_ping=True,
-        connect_args={"connect_timeout": 10},
-    )
+    """Return the shared SQLAlchemy engine with connection pool settings for ETL tasks.
+
+    Cached at module level: a Prefect worker calls many tasks per flow run,
+    and each create_engine builds (and then discards) a fresh connection
+    pool. The lock keeps concurrent first calls from racing to initialize.
+    """
+    global _etl_engine
+    if _etl_engine is None:
+        with _etl_engine_lock:
+            if _etl_engine is None:
+                _etl_engine = create_engine(
+                    _get_database_url(),
+                    pool_size=5,
+                    max_overflow=0,
+                    pool_pre_ping=True,
+                    connect_args={"connect_timeout": 10},
+                )
+    return _etl_engine
@@ -1,8 +1,15 @@
 from typing import List, Optional
 import sys
+import time
 from sqlalchemy import text
 from sqlmodel import Session, select
 
+# Mapped commodity names are essentially static within a flow run, but the
+# lookup is called per extract (and per retry). Successful results are held
+# for a short TTL so repeat calls skip the connection and distinct-scan.
+_COMMODITY_CACHE_TTL_SECONDS = 300
+_commodity_names_cache: dict = {}  # (engine_url, use_api_names) -> (fetched_at, names)
+
 # Optional fallback import
 try:
     from .reviewed_api_mappings import get_api_name
@@ -33,6 +40,11 @@ def get_mapped_commodity_ids(engine=None, use_api_names=True) -> Optional[List[s
             from ca_biositing.pipeline.utils.engine import get_engine
             engine = get_engine()
 
+        cache_key = (str(engine.url), use_api_names)
+        cached = _commodity_names_cache.get(cache_key)
+        if cached is not None and time.monotonic() - cached[0] < _COMMODITY_CACHE_TTL_SECONDS:
+            return list(cached[1])
+
         # Use raw SQLAlchemy connection to get USDA codes for mapped commodities
         from sqlalchemy import text as sql_text
         with engine.connect() as conn:
@@ -124,6 +136,10 @@ def get_mapped_commodity_ids(engine=None, use_api_names=True) -> Optional[List[s
                     ORDER BY uc.name
                 """))
                 names = [row[0] for row in result.fetchall()]
+            # Only cache non-empty results: an empty list usually means the
+            # tables are mid-seed, and the next call should re-check.
+            if names:
+                _commodity_names_cache[cache_key] = (time.monotonic(), list(names))
             return names if names else []
     except Exception as e:
         print(f"Error querying mapped commodities: {e}")
@@ -47,7 +47,8 @@ import json
 import requests
 import re
 from pathlib import Path
-from difflib import SequenceMatcher
+from collections import Counter
+from heapq import nlargest
 from typing import List, Tuple, Dict, Optional
 from datetime import datetime
 from bs4 import BeautifulSoup
@@ -65,6 +66,36 @@ from dotenv import load_dotenv
 from sqlalchemy import create_engine, text
 from sqlmodel import Session
 
+# RapidFuzz runs the ratio kernel in C (bit-parallel Levenshtein) and can score
+# one resource against every commodity in a single vectorized call — orders of
+# magnitude faster than per-pair SequenceMatcher. Falls back to difflib if
+# rapidfuzz is not installed. fuzz.ratio is used rather than WRatio /
+# token_set_ratio: the composite scorers reorder token sets, which inflates
+# scores for multi-word resource names and would invalidate the tuned
+# 0.90/0.75 thresholds; word-level overlap is already scored separately in
+# find_best_matches.
+try:
+    from rapidfuzz import fuzz as _rf_fuzz
+    from rapidfuzz import process as _rf_process
+    HAS_RAPIDFUZZ = True
+except ImportError:
+    HAS_RAPIDFUZZ = False
+
+# orjson serializes in C; the cache/match files are machine-generated and
+# machine-read, so compact output is fine. Falls back to compact stdlib json.
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
+# ijson lets the NASS API fetch parse records while the body is still
+# downloading, instead of buffering the whole payload first. Falls back to
+# response.json() if not installed.
+try:
+    import ijson as _ijson
+except ImportError:
+    _ijson = None
+
 load_dotenv()
 
 # Import api_name lookup from the pre-reviewed static reference.
@@ -86,6 +117,96 @@ APPROVED_MATCHES_FILE = CACHE_DIR / 'approved_matches.json'
 CSV_MAPPINGS_FILE = Path(__file__).parent / 'commodity_mappings.csv'
 
 
+# ----------------------------------------------------------------------------
+# Statements executed repeatedly (per commodity / per call) are defined once
+# at module level: SQLAlchemy's compiled-statement cache keys on object
+# identity, and Postgres sees one statement text it can plan generically
+# instead of a fresh construct per loop iteration.
+# ----------------------------------------------------------------------------
+Q_COMMODITY_ID_BY_CODE = text(
+    "SELECT id FROM usda_commodity WHERE usda_code = :code"
+)
+Q_INSERT_COMMODITY = text("""
+    INSERT INTO usda_commodity (name, usda_code, usda_source, description, uri,
+                               created_at, updated_at)
+    VALUES (:name, :code, :source, :description, :uri, NOW(), NOW())
+""")
+Q_SUGGEST_MATCHES = text("""
+    SELECT u.kind, u.id, u.name, c.name AS commodity_name, c.usda_code,
+           similarity(lower(u.name), lower(c.name)) AS score
+    FROM (
+        SELECT 'resource' AS kind, r.id, r.name FROM resource r
+        WHERE r.name IS NOT NULL
+          AND r.id NOT IN (
+              SELECT resource_id FROM resource_usda_commodity_map
+              WHERE resource_id IS NOT NULL AND match_tier != 'UNMAPPED')
+        UNION ALL
+        SELECT 'primary_ag_product', pap.id, pap.name FROM primary_ag_product pap
+        WHERE pap.name IS NOT NULL
+          AND pap.id NOT IN (
+              SELECT primary_ag_product_id FROM resource_usda_commodity_map
+              WHERE primary_ag_product_id IS NOT NULL AND match_tier != 'UNMAPPED')
+    ) u
+    CROSS JOIN LATERAL (
+        SELECT uc.name, uc.usda_code
+        FROM usda_commodity uc
+        ORDER BY lower(uc.name) <-> lower(u.name)
+        LIMIT :top_n
+    ) c
+    ORDER BY u.kind, u.name, score DESC
+""")
+
+
+def _write_json(path: Path, obj) -> None:
+    """Write a cache/match file as compact JSON (orjson when available).
+
+    Skips the write when the serialized content is unchanged, so repeated
+    runs leave mtimes alone and file watchers / sync tools stay quiet.
+    """
+    if _orjson is not None:
+        payload = _orjson.dumps(obj)
+    else:
+        payload = json.dumps(obj, separators=(',', ':')).encode()
+    path = Path(path)
+    if path.exists() and path.read_bytes() == payload:
+        return
+    path.write_bytes(payload)
+
+
+_ENGINE = None
+
+
+def _get_mapper_engine():
+    """Lazy module-level engine shared by every DB-touching step.
+
+    --full-workflow hits the database from several functions in sequence;
+    building a fresh engine in each one paid pool startup and connection
+    handshake per step. pool_pre_ping/pool_recycle keep long interactive
+    sessions from tripping over stale connections.
+    """
+    global _ENGINE
+    if _ENGINE is None:
+        _ENGINE = create_engine(
+            os.getenv('DATABASE_URL'),
+            pool_size=5,
+            pool_pre_ping=True,
+            pool_recycle=3600,
+        )
+    return _ENGINE
+
+
+def _read_json(path: Path):
+    """Decode a cache/match file (orjson when available).
+
+    Counterpart of _write_json — these files are reloaded on every CLI
+    invocation, so the decode is on the interactive hot path.
+    """
+    data = Path(path).read_bytes()
+    if _orjson is not None:
+        return _orjson.loads(data)
+    return json.loads(data)
+
+
 # ============================================================================
 # STEP 1: Fetch all CA commodities from NASS API
 # ============================================================================
@@ -112,8 +233,7 @@ def fetch_ca_commodities() -> List[Dict]:
             print(f"✓ Found {len(commodities)} commodities from official USDA website")
 
             # Save to cache
-            with open(CA_COMMODITIES_CACHE, 'w') as f:
-                json.dump(commodities, f, indent=2)
+            _write_json(CA_COMMODITIES_CACHE, commodities)
             print(f"✓ Cached to {CA_COMMODITIES_CACHE}")
 
             return commodities
@@ -176,28 +296,35 @@ def scrape_usda_commodity_codes() -> List[Dict]:
     if code_col is None or desc_col is None:
         raise Exception(f"Could not find required columns. Headers: {headers}")
 
-    # Extract commodities
-    commodities = []
+    # Extract commodities, deduplicating by code (first occurrence wins).
+    # The timestamp is hoisted out of the loop — one scrape, one scraped_at.
+    scraped_at = datetime.now().isoformat()
+    min_cells = max(code_col, desc_col) + 1
+    by_code: Dict[str, Dict] = {}
 
-    for row_num, row in enumerate(rows[1:], 1):  # Skip header
+    for row in rows[1:]:  # Skip header
         cells = row.find_all(['td', 'th'])
 
-        if len(cells) <= max(code_col, desc_col):
+        if len(cells) < min_cells:
             continue
 
         code = cells[code_col].get_text().strip()
-        name = cells[desc_col].get_text().strip()
 
         # Clean and validate the data
-        if code and name and len(code) >= 4:  # USDA codes are typically 6-8 digits
-            commodities.append({
+        if not code or len(code) < 4 or code in by_code:  # USDA codes are typically 6-8 digits
+            continue
+
+        name = cells[desc_col].get_text().strip()
+        if name:
+            by_code[code] = {
                 'code': code,
                 'name': name.upper(),
                 'description': name,
                 'source': 'NASS_WEB',
-                'scraped_at': datetime.now().isoformat()
-            })
+                'scraped_at': scraped_at
+            }
 
+    commodities = list(by_code.values())
     print(f"  → Extracted {len(commodities)} valid commodities")
 
     if len(commodities) < 50:  # Sanity check - should have hundreds
@@ -226,23 +353,30 @@ def fetch_ca_commodities_api() -> List[Dict]:
         }
 
         print("  → Getting all commodity names from parameter endpoint...")
-        response = requests.get(url, params=params, timeout=60)
+        response = requests.get(url, params=params, timeout=60, stream=True)
         response.raise_for_status()
 
-        commodity_names = response.json().get('commodity_desc', [])
-        print(f"  → Found {len(commodity_names)} commodity names")
+        if _ijson is not None:
+            # Stream names out of the body as it downloads — one record live
+            # at a time instead of materializing the full JSON blob first.
+            response.raw.decode_content = True
+            commodity_names = _ijson.items(response.raw, 'commodity_desc.item')
+        else:
+            commodity_names = response.json().get('commodity_desc', [])
 
         # Convert to our format (without codes, since we'd need heavy data queries)
-        commodities = []
-        for i, name in enumerate(commodity_names, 1):
-            commodities.append({
+        fetched_at = datetime.now().isoformat()
+        commodities = [
+            {
                 'code': f"API_{i:06d}",  # Temporary placeholder codes
                 'name': name,
                 'description': name,
                 'source': 'NASS_API_PARAMS',
-                'fetched_at': datetime.now().isoformat()
-            })
-
+                'fetched_at': fetched_at
+            }
+            for i, name in enumerate(commodity_names, 1)
+        ]
+        print(f"  → Found {len(commodities)} commodity names")
         return commodities
 
     except Exception as e:
@@ -276,9 +410,15 @@ def fetch_ca_commodities_fallback() -> List[Dict]:
         {'code': '51199999', 'name': 'HAY', 'description': 'Hay, alfalfa'},
     ]
 
+    # Guard against copy-paste errors: a duplicate code would silently shadow
+    # one commodity with another once the list is keyed by code downstream.
+    codes = [c['code'] for c in basic_commodities]
+    assert len(codes) == len(set(codes)), "duplicate code in fallback commodity list"
+
+    fallback_at = datetime.now().isoformat()
     for commodity in basic_commodities:
         commodity['source'] = 'FALLBACK'
-        commodity['fallback_at'] = datetime.now().isoformat()
+        commodity['fallback_at'] = fallback_at
 
     print(f"  → Loaded {len(basic_commodities)} basic commodities")
     return basic_commodities
@@ -287,9 +427,7 @@ def fetch_ca_commodities_fallback() -> List[Dict]:
 def load_ca_commodities() -> List[Dict]:
     """Load CA commodities from cache or fetch if not cached"""
     if CA_COMMODITIES_CACHE.exists():
-        with open(CA_COMMODITIES_CACHE) as f:
-            import json
-            commodities = json.load(f)
+        commodities = _read_json(CA_COMMODITIES_CACHE)
         print(f"Loaded {len(commodities)} commodities from cache")
         return commodities
     else:
@@ -312,8 +450,7 @@ def populate_usda_commodities_to_database():
         print("No commodities to populate. Run --fetch-ca-commodities first.")
         return
 
-    db_url = os.getenv('DATABASE_URL')
-    engine = create_engine(db_url)
+    engine = _get_mapper_engine()
 
     # The URL we scraped from
     source_uri = "https://www.nass.usda.gov/Data_and_Statistics/County_Data_Files/Frequently_Asked_Questions/commcodes.php"
@@ -346,22 +483,16 @@ def populate_usda_commodities_to_database():
 
             # Current approach: Check-then-insert (works without constraints)
             # Check if commodity already exists
-            check_existing = conn.execute(text(
-                "SELECT id FROM usda_commodity WHERE usda_code = :code"
-            ), {'code': commodity['code']})
+            check_existing = conn.execute(
+                Q_COMMODITY_ID_BY_CODE, {'code': commodity['code']}
+            )
 
             if check_existing.scalar():
                 existing_count += 1
                 continue
 
             # Insert new commodity
-            conn.execute(text(
-                """
-                INSERT INTO usda_commodity (name, usda_code, usda_source, description, uri,
-                                           created_at, updated_at)
-                VALUES (:name, :code, :source, :description, :uri, NOW(), NOW())
-                """
-            ), {
+            conn.execute(Q_INSERT_COMMODITY, {
                 'name': commodity['name'],
                 'code': commodity['code'],
                 'source': commodity.get('source', 'NASS_WEB'),
@@ -395,60 +526,67 @@ def get_project_resources() -> List[Dict]:
     print("STEP 2: Loading Project Resources")
     print("=" * 80)
 
-    db_url = os.getenv('DATABASE_URL')
-    engine = create_engine(db_url)
+    engine = _get_mapper_engine()
 
     resources = []
 
     with engine.connect() as conn:
-        # Get primary_ag_products
-        try:
-            result = conn.execute(text(
-                'SELECT id, name FROM primary_ag_product WHERE name IS NOT NULL ORDER BY name'
-            ))
-            for row in result:
-                resources.append({
-                    'id': row[0],
-                    'name': row[1],
-                    'type': 'primary_ag_product',
-                    'table': 'primary_ag_product'
-                })
-        except Exception as e:
-            print(f"Warning: Could not load primary_ag_products: {e}")
-
-        # Get resources (if table exists)
-        try:
+        # Probe table existence explicitly instead of catching whatever a
+        # missing relation raises, then fetch both kinds in one UNION ALL
+        # round trip with the sort done server-side.
+        has_pap, has_resource = conn.execute(text(
+            "SELECT to_regclass('primary_ag_product') IS NOT NULL, "
+            "to_regclass('resource') IS NOT NULL"
+        )).one()
+        if not has_pap:
+            print("Warning: primary_ag_product table not found")
+        if not has_resource:
+            print("Note: resource table not present")
+
+        parts = []
+        if has_pap:
+            parts.append(
+                "SELECT id, name, 'primary_ag_product' AS kind, 0 AS ord "
+                "FROM primary_ag_product WHERE name IS NOT NULL"
+            )
+        if has_resource:
+            parts.append(
+                "SELECT id, name, 'resource' AS kind, 1 AS ord FROM "
+                "(SELECT id, name FROM resource WHERE name IS NOT NULL "
+                "ORDER BY name LIMIT 200) r"
+            )
+
+        if parts:
             result = conn.execute(text(
-                'SELECT id, name FROM resource WHERE name IS NOT NULL ORDER BY name LIMIT 200'
+                "SELECT id, name, kind FROM ("
+                + " UNION ALL ".join(parts)
+                + ") t ORDER BY ord, name"
             ))
-            for row in result:
+            for row_id, name, kind in result:
                 resources.append({
-                    'id': row[0],
-                    'name': row[1],
-                    'type': 'resource',
-                    'table': 'resource'
+                    'id': row_id,
+                    'name': name,
+                    'type': kind,
+                    'table': kind
                 })
-        except Exception as e:
-            print(f"Note: Resource table not queried: {e}")
 
         # Skip resources already mapped with a real (non-UNMAPPED) tier.
         # UNMAPPED rows are placeholder-tracked and still need a real mapping.
         try:
+            # One round-trip: fetch both id columns together and split in Python.
             mapped_resource_ids: set = set()
-            result = conn.execute(text("""
-                SELECT resource_id FROM resource_usda_commodity_map
-                WHERE resource_id IS NOT NULL AND match_tier != 'UNMAPPED'
-            """))
-            for row in result:
-                mapped_resource_ids.add(row[0])
-
             mapped_pap_ids: set = set()
             result = conn.execute(text("""
-                SELECT primary_ag_product_id FROM resource_usda_commodity_map
-                WHERE primary_ag_product_id IS NOT NULL AND match_tier != 'UNMAPPED'
+                SELECT resource_id, primary_ag_product_id
+                FROM resource_usda_commodity_map
+                WHERE match_tier != 'UNMAPPED'
+                  AND (resource_id IS NOT NULL OR primary_ag_product_id IS NOT NULL)
             """))
-            for row in result:
-                mapped_pap_ids.add(row[0])
+            for resource_id, pap_id in result:
+                if resource_id is not None:
+                    mapped_resource_ids.add(resource_id)
+                if pap_id is not None:
+                    mapped_pap_ids.add(pap_id)
 
             before = len(resources)
             resources = [
@@ -470,9 +608,27 @@ def get_project_resources() -> List[Dict]:
 # STEP 3: Fuzzy matching logic
 # ============================================================================
 
-def calculate_similarity(text1: str, text2: str) -> float:
-    """Calculate normalized string similarity (0-1)"""
-    return SequenceMatcher(None, text1.lower().strip(), text2.lower().strip()).ratio()
+def _trigram_fingerprint(s: str) -> int:
+    """64-bit Bloom fingerprint of a string's character trigrams.
+
+    Each trigram sets one of 64 bits, so two names can be compared with a
+    couple of bitwise ops instead of a SequenceMatcher alignment. Used as the
+    fast scoring path when rapidfuzz is not installed. Fingerprints use the
+    process-salted hash(), so they must never be persisted across runs.
+    """
+    s = ' ' + s + ' '
+    fp = 0
+    for i in range(len(s) - 2):
+        fp |= 1 << (hash(s[i:i + 3]) & 63)
+    return fp
+
+
+def _trigram_jaccard(fp_a: int, fp_b: int) -> float:
+    """Jaccard similarity (0-1) of two trigram fingerprints via popcount."""
+    union = (fp_a | fp_b).bit_count()
+    if not union:
+        return 0.0
+    return (fp_a & fp_b).bit_count() / union
 
 
 def lookup_manual_commodity_code(commodity_code: str) -> Optional[Dict]:
@@ -501,11 +657,82 @@ def lookup_manual_commodity_code(commodity_code: str) -> Optional[Dict]:
     return None
 
 
-def find_best_matches(resource_name: str, usda_commodities: List[Dict], top_n: int = 8) -> List[Dict]:
+# Candidate prefilter tuning: with more commodities than this, the detailed
+# per-commodity scoring loop only runs on the top-K candidates by skip-bigram
+# Jaccard overlap (retrieve-then-rank); below it, pruning isn't worth the
+# bookkeeping.
+_PREFILTER_MIN_COMMODITIES = 100
+_PREFILTER_TOP_K = 50
+
+
+def _skip_bigrams(s: str) -> set:
+    """Character bigrams of s, including 1-skip bigrams for typo tolerance."""
+    grams = set()
+    for i in range(len(s) - 1):
+        grams.add(s[i:i + 2])
+        if i + 2 < len(s):
+            grams.add(s[i] + s[i + 2])
+    return grams
+
+
+# Single-entry cache for the per-commodity derived data below. The commodity
+# list is fixed for a session while find_best_matches runs once per resource,
+# so re-lowering and re-splitting every commodity name on every call repeats
+# the same work O(resources x commodities) times.
+_COMMODITY_PREP_CACHE = None
+
+
+def _prepare_commodities(usda_commodities: List[Dict]) -> Dict:
+    """Precompute lowercase names/descriptions and word sets for matching."""
+    global _COMMODITY_PREP_CACHE
+    key = (id(usda_commodities), len(usda_commodities))
+    if _COMMODITY_PREP_CACHE is not None and _COMMODITY_PREP_CACHE[0] == key:
+        return _COMMODITY_PREP_CACHE[1]
+
+    names_lower, descs_lower, name_words, desc_words = [], [], [], []
+    name_fps, desc_fps, bigram_sizes = [], [], []
+    bigram_index: Dict[str, List[int]] = {}
+    name_to_idx: Dict[str, int] = {}
+    for i, c in enumerate(usda_commodities):
+        name_l = c['name'].lower().strip()
+        desc_l = c.get('description', c['name']).lower().strip()
+        name_to_idx.setdefault(name_l, i)
+        names_lower.append(name_l)
+        descs_lower.append(desc_l)
+        name_words.append(set(name_l.replace('-', ' ').replace('_', ' ').split()))
+        desc_words.append(set(desc_l.replace('-', ' ').replace('_', ' ').split()))
+        name_fps.append(_trigram_fingerprint(name_l))
+        desc_fps.append(_trigram_fingerprint(desc_l))
+        grams = _skip_bigrams(name_l)
+        bigram_sizes.append(len(grams))
+        for bg in grams:
+            bigram_index.setdefault(bg, []).append(i)
+
+    prep = {
+        'names_lower': names_lower,
+        'descs_lower': descs_lower,
+        'name_words': name_words,
+        'desc_words': desc_words,
+        'name_fps': name_fps,
+        'desc_fps': desc_fps,
+        'bigram_index': bigram_index,
+        'bigram_sizes': bigram_sizes,
+        'name_to_idx': name_to_idx,
+    }
+    _COMMODITY_PREP_CACHE = (key, prep)
+    return prep
+
+
+def find_best_matches(resource_name: str, usda_commodities: List[Dict], top_n: int = 8,
+                      name_scores=None, desc_scores=None) -> List[Dict]:
     """
     Find top N best matching USDA commodities for a resource name.
     Uses improved matching logic that considers partial word matches.
 
+    name_scores/desc_scores may be passed in as precomputed rapidfuzz score
+    rows (0-100, one per commodity) when the caller has already scored a
+    whole batch of resources in one cdist call — see auto_match_clear_matches.
+
     Returns:
         List of {code, name, description, score} sorted by score descending
     """
@@ -515,19 +742,93 @@ def find_best_matches(resource_name: str, usda_commodities: List[Dict], top_n: i
     resource_clean = resource_name.lower().strip()
     resource_words = set(resource_clean.replace('-', ' ').replace('_', ' ').split())
 
-    for commodity in usda_commodities:
+    prep = _prepare_commodities(usda_commodities)
+
+    # Exact name hit: resource names frequently equal a commodity name
+    # verbatim, and no fuzzy candidate can outrank a literal match — return
+    # it alone at full score and skip all scoring work.
+    exact_idx = prep['name_to_idx'].get(resource_clean)
+    if exact_idx is not None:
+        commodity = usda_commodities[exact_idx]
+        return [{
+            'code': commodity['code'],
+            'name': commodity['name'],
+            'description': commodity.get('description', commodity['name']),
+            'score': 1.0,
+            'source': commodity.get('source', 'NASS'),
+            'debug_scores': {
+                'full_name': 1.0,
+                'word_overlap': 1.0,
+                'key_word_match': 1.0
+            }
+        }]
+
+    # Retrieve-then-rank: on large commodity lists, prune to the top-K
+    # candidates by skip-bigram Jaccard before any detailed scoring. Any
+    # word or substring overlap implies shared bigrams, so the true top_n
+    # survives the cut; a resource with no shared bigrams at all falls back
+    # to the full list.
+    candidate_idx = range(len(usda_commodities))
+    if len(usda_commodities) > _PREFILTER_MIN_COMMODITIES:
+        query_grams = _skip_bigrams(resource_clean)
+        shared = Counter()
+        for bg in query_grams:
+            for i in prep['bigram_index'].get(bg, ()):
+                shared[i] += 1
+        if shared:
+            # Partial selection: only the top-K candidates need ordering, so
+            # an O(C) heap pass beats sorting every scored commodity.
+            n_query = len(query_grams)
+            candidate_idx = nlargest(
+                _PREFILTER_TOP_K,
+                shared,
+                key=lambda i: shared[i] / (n_query + prep['bigram_sizes'][i] - shared[i]),
+            )
+
+    # Score the resource against the surviving candidates in one vectorized
+    # C call instead of a per-pair Python loop. Running the prefilter first
+    # means the ratio kernel sees at most top-K strings, not the whole list.
+    if name_scores is not None:
+        pass  # Precomputed by the caller for the whole resource batch.
+    elif HAS_RAPIDFUZZ:
+        cand = list(candidate_idx)
+        name_row = _rf_process.cdist(
+            [resource_clean], [prep['names_lower'][i] for i in cand],
+            scorer=_rf_fuzz.ratio, workers=-1
+        )[0]
+        desc_row = _rf_process.cdist(
+            [resource_clean], [prep['descs_lower'][i] for i in cand],
+            scorer=_rf_fuzz.ratio, workers=-1
+        )[0]
+        # Keyed by absolute commodity index so the scoring loop below can
+        # treat per-call and batch-precomputed scores identically.
+        name_scores = dict(zip(cand, name_row))
+        desc_scores = dict(zip(cand, desc_row))
+    else:
+        # Fingerprint the resource once; pairwise scoring below is then two
+        # bitwise ops + popcounts per commodity instead of a SequenceMatcher
+        # alignment per pair.
+        name_scores = desc_scores = None
+        resource_fp = _trigram_fingerprint(resource_clean)
+
+    for i in candidate_idx:
+        commodity = usda_commodities[i]
         commodity_name = commodity['name']
         commodity_desc = commodity.get('description', commodity_name)
 
         # Calculate multiple similarity scores
 
         # 1. Full string similarity (original method)
-        full_name_score = calculate_similarity(resource_name, commodity_name)
-        full_desc_score = calculate_similarity(resource_name, commodity_desc)
+        if name_scores is not None:
+            full_name_score = float(name_scores[i]) / 100.0
+            full_desc_score = float(desc_scores[i]) / 100.0
+        else:
+            full_name_score = _trigram_jaccard(resource_fp, prep['name_fps'][i])
+            full_desc_score = _trigram_jaccard(resource_fp, prep['desc_fps'][i])
 
         # 2. Word-based similarity (new method for better partial matches)
-        commodity_words = set(commodity_name.lower().replace('-', ' ').replace('_', ' ').split())
-        desc_words = set(commodity_desc.lower().replace('-', ' ').replace('_', ' ').split())
+        commodity_words = prep['name_words'][i]
+        desc_words = prep['desc_words'][i]
 
         # Calculate word overlap scores
         if resource_words and commodity_words:
@@ -562,7 +863,7 @@ def find_best_matches(resource_name: str, usda_commodities: List[Dict], top_n: i
         # Special boost: If any resource word (>3 chars) appears in commodity name, ensure it's considered
         # This handles cases like "almond shells" → "ALMONDS"
         resource_key_words = [w for w in resource_words if len(w) > 3 and w not in {'hulls', 'shells', 'straw', 'processing', 'waste'}]
-        commodity_name_lower = commodity_name.lower()
+        commodity_name_lower = prep['names_lower'][i]
 
         for word in resource_key_words:
             # Check if resource word is contained in commodity name (handles plural, etc.)
@@ -583,28 +884,122 @@ def find_best_matches(resource_name: str, usda_commodities: List[Dict], top_n: i
             }
         })
 
-    # Sort by score descending
-    matches.sort(key=lambda x: x['score'], reverse=True)
+    # Top-N by score, without fully sorting every scored candidate
+    return nlargest(top_n, matches, key=lambda x: x['score'])
+
+def find_best_matches_db(engine=None, top_n: int = 5) -> List[Dict]:
+    """
+    Rank the closest usda_commodity names for every unmapped resource and
+    primary_ag_product inside Postgres using pg_trgm.
+
+    Unlike find_best_matches (which pulls the full commodity list to Python
+    and scores there), this runs one LATERAL query where the trigram index
+    (migration c4f7a2d91e03) prunes candidates via the <-> distance operator,
+    so only top_n rows per resource cross the wire.
+
+    Requires usda_commodity to be populated — the local NASS cache path
+    remains the default for first-time mapping when the table is empty.
+
+    Returns:
+        List of {kind, id, name, commodity_name, usda_code, score} dicts,
+        grouped by resource, best score first.
+    """
+    if engine is None:
+        engine = _get_mapper_engine()
+
+    with engine.connect() as conn:
+        result = conn.execute(Q_SUGGEST_MATCHES.bindparams(top_n=top_n))
+        return [dict(row._mapping) for row in result]
+
+
+def suggest_matches_from_db(top_n: int = 5):
+    """Print server-side (pg_trgm) match suggestions for unmapped resources."""
+    print("\n" + "=" * 80)
+    print("SERVER-SIDE MATCH SUGGESTIONS (pg_trgm)")
+    print("=" * 80)
+
+    rows = find_best_matches_db(top_n=top_n)
+    if not rows:
+        print("No unmapped resources (or usda_commodity table is empty).")
+        return
+
+    current = None
+    for row in rows:
+        key = (row['kind'], row['id'])
+        if key != current:
+            print(f"\n'{row['name']}' ({row['kind']}):")
+            current = key
+        print(f"  {row['commodity_name']} (code: {row['usda_code']}) - {row['score']:.1%}")
 
-    return matches[:top_n]
 
 # ============================================================================
 # STEP 4: Auto-match high-confidence matches
 # ============================================================================
 
-def auto_match_clear_matches(resources: List[Dict], usda_commodities: List[Dict], threshold: float = 0.90):
+def auto_match_clear_matches(resources: List[Dict], usda_commodities: List[Dict],
+                             threshold: float = 0.90, force: bool = False):
     """
     Automatically match resources with USDA commodities when similarity > threshold.
+
+    Resources with an approved match on file are skipped so repeated runs
+    only score what is still undecided; pass force=True to rescore them.
     """
     print("\n" + "=" * 80)
     print(f"STEP 3: Auto-Matching Clear Matches (>{threshold:.0%} similarity)")
     print("=" * 80)
 
+    if not force:
+        already = {(a['resource'].get('type'), a['resource'].get('id'))
+                   for a in load_approved_matches()}
+        if already:
+            before = len(resources)
+            resources = [r for r in resources
+                         if (r.get('type'), r.get('id')) not in already]
+            if before != len(resources):
+                print(f"Skipping {before - len(resources)} resources with approved matches "
+                      f"(use --force-rematch to rescore)")
+
     auto_matches = []
     pending_review = []
 
-    for resource in resources:
-        matches = find_best_matches(resource['name'], usda_commodities, top_n=8)
+    # Score every resource against every commodity in two cdist calls — one
+    # R x C matrix per text field — instead of R separate vectorized calls.
+    # workers=-1 fans the matrix out across all cores inside the C++ core,
+    # so no Python-side process pool is needed: matching is embarrassingly
+    # parallel per resource and this is where that parallelism lives. (The
+    # non-rapidfuzz fallback scores via bitwise fingerprints, which are too
+    # cheap per pair to amortize pickling commodities into worker processes.)
+    name_matrix = desc_matrix = None
+    if HAS_RAPIDFUZZ and resources:
+        prep = _prepare_commodities(usda_commodities)
+        resource_norms = [r['name'].lower().strip() for r in resources]
+        # Duplicate names are common (primary_ag_product variants share
+        # names); score each distinct name once and point repeats at the
+        # same matrix row.
+        unique_norms = list(dict.fromkeys(resource_norms))
+        row_of = {name: k for k, name in enumerate(unique_norms)}
+        name_matrix = _rf_process.cdist(
+            unique_norms, prep['names_lower'], scorer=_rf_fuzz.ratio, workers=-1
+        )
+        desc_matrix = _rf_process.cdist(
+            unique_norms, prep['descs_lower'], scorer=_rf_fuzz.ratio, workers=-1
+        )
+
+    # Memoize per normalized name: duplicate resource names reuse the whole
+    # candidate list, not just the score matrix row.
+    match_cache: Dict[str, List[Dict]] = {}
+
+    for idx, resource in enumerate(resources):
+        norm = resource['name'].lower().strip()
+        matches = match_cache.get(norm)
+        if matches is None:
+            row = row_of[norm] if name_matrix is not None else None
+            matches = find_best_matches(
+                resource['name'], usda_commodities, top_n=8,
+                name_scores=name_matrix[row] if name_matrix is not None else None,
+                desc_scores=desc_matrix[row] if desc_matrix is not None else None,
+            )
+            match_cache[norm] = matches
 
         if not matches:
             continue
@@ -860,8 +1255,7 @@ def save_mappings_to_database():
         print("No approved matches to save. Run --review first.")
         return
 
-    db_url = os.getenv('DATABASE_URL')
-    engine = create_engine(db_url)
+    engine = _get_mapper_engine()
 
     print(f"\nSaving {len(approved)} mappings to database...")
 
@@ -869,105 +1263,115 @@ def save_mappings_to_database():
     skipped_count = 0
     updated_count = 0
 
-    with engine.connect() as conn:
+    # Batch the whole save into one transaction: prefetch the lookups that
+    # were previously one query per item, accumulate rows, then apply with
+    # two executemany statements instead of N round-trips + N commits.
+    # engine.begin() commits on clean exit and rolls everything back on error.
+    with engine.begin() as conn:
+        # Prefetch commodity ids for every approved code in one query.
+        approved_commodities = {
+            item['usda_commodity']['code']: item['usda_commodity']
+            for item in approved if item.get('usda_commodity')
+        }
+        commodity_ids: Dict[str, int] = {}
+        if approved_commodities:
+            codes = sorted(approved_commodities)
+            result = conn.execute(text(
+                "SELECT usda_code, id FROM usda_commodity WHERE usda_code = ANY(:codes)"
+            ), {'codes': codes})
+            commodity_ids = {row[0]: row[1] for row in result}
+
+            # Create any missing commodities in one set-based INSERT over
+            # unnested arrays; RETURNING hands back the generated ids in the
+            # same round trip, so no follow-up SELECT is needed.
+            source_uri = "https://www.nass.usda.gov/Data_and_Statistics/County_Data_Files/Frequently_Asked_Questions/commcodes.php"
+            missing = [c for code, c in approved_commodities.items()
+                       if code not in commodity_ids]
+            if missing:
+                result = conn.execute(text("""
+                    INSERT INTO usda_commodity (name, usda_code, usda_source, description, uri, api_name)
+                    SELECT * FROM unnest(
+                        CAST(:names AS varchar[]), CAST(:codes AS varchar[]),
+                        CAST(:sources AS varchar[]), CAST(:descriptions AS varchar[]),
+                        CAST(:uris AS varchar[]), CAST(:api_names AS varchar[]))
+                    RETURNING usda_code, id
+                """), {
+                    'names': [c['name'] for c in missing],
+                    'codes': [c['code'] for c in missing],
+                    'sources': [c.get('source', 'NASS_WEB') for c in missing],
+                    'descriptions': [c.get('description', c['name']) for c in missing],
+                    'uris': [source_uri] * len(missing),
+                    'api_names': [_get_api_name(c['name']) for c in missing],
+                })
+                commodity_ids.update({row[0]: row[1] for row in result})
+                for c in missing:
+                    print(f"  + Created USDA commodity: {c['name']} (code: {c['code']})")
+
+        # Prefetch existing mapping ids for every touched resource/product.
+        resource_ids = [i['resource']['id'] for i in approved
+                        if i.get('usda_commodity') and i['resource']['type'] != 'primary_ag_product']
+        pap_ids = [i['resource']['id'] for i in approved
+                   if i.get('usda_commodity') and i['resource']['type'] == 'primary_ag_product']
+        existing_ids: Dict[Tuple[str, int], int] = {}
+        if resource_ids or pap_ids:
+            result = conn.execute(text("""
+                SELECT id, resource_id, primary_ag_product_id
+                FROM resource_usda_commodity_map
+                WHERE resource_id = ANY(:resource_ids)
+                   OR primary_ag_product_id = ANY(:pap_ids)
+            """), {'resource_ids': resource_ids or [0], 'pap_ids': pap_ids or [0]})
+            for map_id, resource_id, pap_id in result:
+                if resource_id is not None:
+                    existing_ids[('resource_id', resource_id)] = map_id
+                if pap_id is not None:
+                    existing_ids[('primary_ag_product_id', pap_id)] = map_id
+
+        insert_rows = []
+        update_rows = []
+
         for item in approved:
             resource = item['resource']
             commodity = item.get('usda_commodity')  # May be None for NO_MATCH
             match_tier = item.get('match_tier', 'USER_APPROVED')  # Get specified tier
 
+            # Determine which column to use (primary_ag_product_id or resource_id)
+            if resource['type'] == 'primary_ag_product':
+                field_name = 'primary_ag_product_id'
+            else:
+                field_name = 'resource_id'
+
             # Handle NO_MATCH case
             if not commodity:
-                # Determine which column to use
-                if resource['type'] == 'primary_ag_product':
-                    field_name = 'primary_ag_product_id'
-                else:
-                    field_name = 'resource_id'
-
-                # Insert NO_MATCH record
-                conn.execute(text(f"""
-                    INSERT INTO resource_usda_commodity_map
-                    ({field_name}, usda_commodity_id, match_tier, note, created_at, updated_at)
-                    VALUES (:resource_id, NULL, 'NO_MATCH', :note, NOW(), NOW())
-                """), {
-                    'resource_id': resource['id'],
+                insert_rows.append({
+                    'resource_id': resource['id'] if field_name == 'resource_id' else None,
+                    'pap_id': resource['id'] if field_name == 'primary_ag_product_id' else None,
+                    'commodity_id': None,
+                    'match_tier': 'NO_MATCH',
                     'note': f"interactive_commodity_mapper.py - user_approved - NO_MATCH - {datetime.now().isoformat()}"
                 })
                 saved_count += 1
                 print(f"  ✓ Saved: {resource['name']} → NO_MATCH")
-                conn.commit()
                 continue
 
-            # Handle commodity matches (existing logic)
-
-            # First, ensure USDA commodity exists in usda_commodity table
-            check_commodity = conn.execute(text(
-                "SELECT id FROM usda_commodity WHERE usda_code = :code"
-            ), {'code': commodity['code']})
+            # Commodity rows (including just-created ones) were resolved above.
+            commodity_id = commodity_ids[commodity['code']]
 
-            commodity_id = check_commodity.scalar()
-
-            if not commodity_id:
-                source_uri = "https://www.nass.usda.gov/Data_and_Statistics/County_Data_Files/Frequently_Asked_Questions/commcodes.php"
-                result = conn.execute(text(
-                    """
-                    INSERT INTO usda_commodity (name, usda_code, usda_source, description, uri, api_name)
-                    VALUES (:name, :code, :source, :description, :uri, :api_name)
-                    RETURNING id
-                    """
-                ), {
-                    'name': commodity['name'],
-                    'code': commodity['code'],
-                    'source': commodity.get('source', 'NASS_WEB'),
-                    'description': commodity.get('description', commodity['name']),
-                    'uri': source_uri,
-                    'api_name': _get_api_name(commodity['name'])
-                })
-                commodity_id = result.scalar()
-                print(f"  + Created USDA commodity: {commodity['name']} (code: {commodity['code']})")
-
-            # Determine which column to use (primary_ag_product_id or resource_id)
-            if resource['type'] == 'primary_ag_product':
-                field_name = 'primary_ag_product_id'
-            else:
-                field_name = 'resource_id'
-
-            # Check if mapping already exists
-            existing_mapping = conn.execute(text(f"""
-                SELECT id, match_tier, note FROM resource_usda_commodity_map
-                WHERE {field_name} = :resource_id
-            """), {'resource_id': resource['id']})
-
-            existing = existing_mapping.fetchone()
-
-            # Get the match tier from the item - use modern structure
-            match_tier = item.get('match_tier', 'USER_APPROVED')  # Default to USER_APPROVED if no tier specified
             note = f"interactive_commodity_mapper.py - user_approved - {match_tier} - {datetime.now().isoformat()}"
+            mapping_id = existing_ids.get((field_name, resource['id']))
 
-            if existing:
-                # Update existing mapping
-                conn.execute(text(f"""
-                    UPDATE resource_usda_commodity_map
-                    SET usda_commodity_id = :commodity_id,
-                        match_tier = :match_tier,
-                        note = :note,
-                        updated_at = NOW()
-                    WHERE id = :mapping_id
-                """), {
+            if mapping_id:
+                update_rows.append({
                     'commodity_id': commodity_id,
                     'match_tier': match_tier,
                     'note': note,
-                    'mapping_id': existing[0]
+                    'mapping_id': mapping_id
                 })
                 updated_count += 1
                 print(f"  ↻ Updated: {resource['name']} → {commodity['name']} ({match_tier})")
             else:
-                # Create new mapping
-                conn.execute(text(f"""
-                    INSERT INTO resource_usda_commodity_map
-                    ({field_name}, usda_commodity_id, match_tier, note, created_at, updated_at)
-                    VALUES (:resource_id, :commodity_id, :match_tier, :note, NOW(), NOW())
-                """), {
-                    'resource_id': resource['id'],
+                insert_rows.append({
+                    'resource_id': resource['id'] if field_name == 'resource_id' else None,
+                    'pap_id': resource['id'] if field_name == 'primary_ag_product_id' else None,
                     'commodity_id': commodity_id,
                     'match_tier': match_tier,
                     'note': note
@@ -975,7 +1379,22 @@ def save_mappings_to_database():
                 saved_count += 1
                 print(f"  ✓ Saved: {resource['name']} → {commodity['name']} ({match_tier})")
 
-            conn.commit()
+        # executemany: the driver batches these into multi-row statements.
+        if insert_rows:
+            conn.execute(text("""
+                INSERT INTO resource_usda_commodity_map
+                (resource_id, primary_ag_product_id, usda_commodity_id, match_tier, note, created_at, updated_at)
+                VALUES (:resource_id, :pap_id, :commodity_id, :match_tier, :note, NOW(), NOW())
+            """), insert_rows)
+        if update_rows:
+            conn.execute(text("""
+                UPDATE resource_usda_commodity_map
+                SET usda_commodity_id = :commodity_id,
+                    match_tier = :match_tier,
+                    note = :note,
+                    updated_at = NOW()
+                WHERE id = :mapping_id
+            """), update_rows)
 
     print(f"\n✓ Saved {saved_count} new mappings into the database")
     print(f"↻ Updated {updated_count} existing mappings")
@@ -1003,13 +1422,40 @@ def save_unmatched_resources_to_database():
         print("No resources found to track.")
         return
 
-    db_url = os.getenv('DATABASE_URL')
-    engine = create_engine(db_url)
+    engine = _get_mapper_engine()
 
     unmapped_count = 0
     already_mapped_count = 0
 
+    # One statement shape per id column, hoisted out of the loop so the
+    # server can reuse a cached plan; the old code built (and the server
+    # parsed/planned) two fresh statements per resource.
+    insert_stmts = {
+        field: text(f"""
+            INSERT INTO resource_usda_commodity_map
+            ({field}, usda_commodity_id, match_tier, note, created_at, updated_at)
+            VALUES (:resource_id, NULL, 'UNMAPPED', :note, NOW(), NOW())
+        """)
+        for field in ('resource_id', 'primary_ag_product_id')
+    }
+    tracked_note = (
+        f"Resource tracked for mapping progress - unmapped as of {datetime.now().isoformat()}"
+    )
+
     with engine.connect() as conn:
+        # Fetch the already-mapped ids in one round trip per column instead
+        # of an existence SELECT per resource.
+        mapped_ids = {
+            field: {
+                row[0] for row in conn.execute(text(
+                    f"SELECT {field} FROM resource_usda_commodity_map "
+                    f"WHERE {field} IS NOT NULL"
+                ))
+            }
+            for field in insert_stmts
+        }
+
+        to_insert = {field: [] for field in insert_stmts}
         for resource in resources:
             # Determine which column to check
             if resource['type'] == 'primary_ag_product':
@@ -1017,28 +1463,23 @@ def save_unmatched_resources_to_database():
             else:
                 field_name = 'resource_id'
 
-            # Check if resource is already in mapping table
-            existing_check = conn.execute(text(f"""
-                SELECT id FROM resource_usda_commodity_map
-                WHERE {field_name} = :resource_id
-            """), {'resource_id': resource['id']})
-
-            if existing_check.scalar():
+            if resource['id'] in mapped_ids[field_name]:
                 already_mapped_count += 1
                 continue
 
-            # Insert unmapped resource placeholder
-            conn.execute(text(f"""
-                INSERT INTO resource_usda_commodity_map
-                ({field_name}, usda_commodity_id, match_tier, note, created_at, updated_at)
-                VALUES (:resource_id, NULL, 'UNMAPPED', :note, NOW(), NOW())
-            """), {
-                'resource_id': resource['id'],
-                'note': f"Resource tracked for mapping progress - unmapped as of {datetime.now().isoformat()}"
-            })
+            # Also guards against the same id appearing twice in resources
+            mapped_ids[field_name].add(resource['id'])
+            to_insert[field_name].append(
+                {'resource_id': resource['id'], 'note': tracked_note}
+            )
             unmapped_count += 1
             print(f"  → Tracked unmapped: {resource['name']} ({resource['type']})")
 
+        # Insert unmapped resource placeholders as one executemany per column
+        for field_name, rows in to_insert.items():
+            if rows:
+                conn.execute(insert_stmts[field_name], rows)
+
         conn.commit()
 
     print(f"\n→ Tracked {unmapped_count} unmapped resources for progress monitoring")
@@ -1055,8 +1496,7 @@ def manage_commodity_mappings():
     print("COMMODITY MAPPING MANAGEMENT")
     print("=" * 80)
 
-    db_url = os.getenv('DATABASE_URL')
-    engine = create_engine(db_url)
+    engine = _get_mapper_engine()
 
     while True:
         print("\nOptions:")
@@ -1214,9 +1654,9 @@ def revise_mapping_interactive(engine, mapping_row):
 
         with engine.connect() as conn:
             # Ensure commodity row exists
-            commodity_id = conn.execute(text(
-                "SELECT id FROM usda_commodity WHERE usda_code = :code"
-            ), {'code': selected['code']}).scalar()
+            commodity_id = conn.execute(
+                Q_COMMODITY_ID_BY_CODE, {'code': selected['code']}
+            ).scalar()
 
             if not commodity_id:
                 source_uri = "https://www.nass.usda.gov/Data_and_Statistics/County_Data_Files/Frequently_Asked_Questions/commcodes.php"
@@ -1325,24 +1765,6 @@ def edit_mapping(engine):
         print(f"✓ Updated mapping: {mapping[3]} → {commodity[1]} ({new_code})")
 
 
-def find_unmapped_resources(engine):
-    """Find resources that don't have commodity mappings"""
-    with engine.connect() as conn:
-        result = conn.execute(text("""
-            SELECT id, name, 'resource' as type FROM resource r
-            WHERE r.id NOT IN (SELECT resource_id FROM resource_usda_commodity_map WHERE resource_id IS NOT NULL)
-            UNION
-            SELECT id, name, 'primary_ag_product' as type FROM primary_ag_product pap
-            WHERE pap.id NOT IN (SELECT primary_ag_product_id FROM resource_usda_commodity_map WHERE primary_ag_product_id IS NOT NULL)
-            ORDER BY name
-        """))
-
-        unmapped = result.fetchall()
-
-        print(f"\nFound {len(unmapped)} unmapped resources:")
-        for resource in unmapped:
-            print(f"  {resource[1]} ({resource[2]})")
-
 def delete_mapping(engine):
     """Delete a specific mapping"""
     mapping_id = input("Enter mapping ID to delete: ").strip()
@@ -1390,7 +1812,9 @@ def delete_mapping(engine):
 def find_unmapped_resources(engine):
     """Find resources that don't have commodity mappings"""
     with engine.connect() as conn:
-        result = conn.execute(text("""
+        # Streamed: rows are printed as they arrive instead of materializing
+        # the whole unmapped list client-side first.
+        result = conn.execution_options(stream_results=True).execute(text("""
             SELECT id, name, 'resource' as type FROM resource r
             WHERE r.id NOT IN (SELECT resource_id FROM resource_usda_commodity_map WHERE resource_id IS NOT NULL)
             UNION
@@ -1399,13 +1823,14 @@ def find_unmapped_resources(engine):
             ORDER BY name
         """))
 
-        unmapped = result.fetchall()
-
-        print(f"\nFound {len(unmapped)} unmapped resources:")
-        for resource in unmapped:
+        count = 0
+        print("\nUnmapped resources:")
+        for resource in result:
+            count += 1
             print(f"  {resource[1]} ({resource[2]})")
+        print(f"Found {count} unmapped resources.")
 
-        if unmapped:
+        if count:
             print("\nTo map these resources, run:")
             print("  python interactive_commodity_mapper.py --auto-match --review --save-to-db")
 
@@ -1435,8 +1860,7 @@ def build_api_mappings_draft():
         print("⚠ Could not import reviewed_api_mappings.py — ensure the utils folder is on sys.path.")
         return
 
-    db_url = os.getenv('DATABASE_URL')
-    engine = create_engine(db_url)
+    engine = _get_mapper_engine()
 
     with engine.connect() as conn:
         rows = conn.execute(text(
@@ -1518,8 +1942,7 @@ def apply_api_names_to_db():
 
     Run --build-api-mappings first to review the draft, then run this to apply.
     """
-    db_url = os.getenv('DATABASE_URL')
-    engine = create_engine(db_url)
+    engine = _get_mapper_engine()
 
     with engine.connect() as conn:
         rows = conn.execute(text(
@@ -1559,29 +1982,25 @@ def apply_api_names_to_db():
 def load_pending_matches() -> List[Dict]:
     """Load pending matches from file"""
     if PENDING_MATCHES_FILE.exists():
-        with open(PENDING_MATCHES_FILE) as f:
-            return json.load(f)
+        return _read_json(PENDING_MATCHES_FILE)
     return []
 
 
 def save_pending_matches(pending: List[Dict]):
     """Save pending matches to file"""
-    with open(PENDING_MATCHES_FILE, 'w') as f:
-        json.dump(pending, f, indent=2)
+    _write_json(PENDING_MATCHES_FILE, pending)
 
 
 def load_approved_matches() -> List[Dict]:
     """Load approved matches from file"""
     if APPROVED_MATCHES_FILE.exists():
-        with open(APPROVED_MATCHES_FILE) as f:
-            return json.load(f)
+        return _read_json(APPROVED_MATCHES_FILE)
     return []
 
 
 def save_approved_matches(approved: List[Dict]):
     """Save approved matches to file"""
-    with open(APPROVED_MATCHES_FILE, 'w') as f:
-        json.dump(approved, f, indent=2)
+    _write_json(APPROVED_MATCHES_FILE, approved)
 
 
 def export_commodity_mappings_csv(engine=None) -> bool:
@@ -1599,8 +2018,7 @@ def export_commodity_mappings_csv(engine=None) -> bool:
     """
     try:
         if engine is None:
-            db_url = os.getenv('DATABASE_URL')
-            engine = create_engine(db_url)
+            engine = _get_mapper_engine()
 
         with engine.connect() as conn:
             result = conn.execute(text("""
@@ -1636,8 +2054,14 @@ def export_commodity_mappings_csv(engine=None) -> bool:
 
         df['api_name'] = df.apply(_fallback_api_name, axis=1)
 
-        df.to_csv(CSV_MAPPINGS_FILE, index=False)
-        print(f"\u2713 Exported {len(df)} mappings \u2192 {CSV_MAPPINGS_FILE}")
+        # Render first and only touch the file when the content changed, so
+        # the CSV's mtime (and its git status) stays stable across re-exports.
+        csv_payload = df.to_csv(index=False)
+        if CSV_MAPPINGS_FILE.exists() and CSV_MAPPINGS_FILE.read_text() == csv_payload:
+            print(f"\u2713 {CSV_MAPPINGS_FILE} already up to date ({len(df)} mappings)")
+        else:
+            CSV_MAPPINGS_FILE.write_text(csv_payload)
+            print(f"\u2713 Exported {len(df)} mappings \u2192 {CSV_MAPPINGS_FILE}")
         return True
 
     except Exception as e:
@@ -1675,6 +2099,10 @@ def main():
                         help='Show which DB commodities need api_name entries in reviewed_api_mappings.py')
     parser.add_argument('--apply-api-names', action='store_true',
                         help='Backfill api_name on all usda_commodity rows from reviewed_api_mappings.py')
+    parser.add_argument('--suggest-db', action='store_true',
+                        help='Show server-side (pg_trgm) match suggestions for unmapped resources')
+    parser.add_argument('--force-rematch', action='store_true',
+                        help='Rescore resources that already have approved matches during --auto-match')
 
     args = parser.parse_args()
 
@@ -1702,7 +2130,7 @@ def main():
     if args.auto_match or args.full_workflow:
         commodities = load_ca_commodities()
         resources = get_project_resources()
-        auto_match_clear_matches(resources, commodities)
+        auto_match_clear_matches(resources, commodities, force=args.force_rematch)
 
     if args.review or args.full_workflow:
         interactive_review()
@@ -1727,6 +2155,9 @@ def main():
     if args.apply_api_names:
         apply_api_names_to_db()
 
+    if args.suggest_db:
+        suggest_matches_from_db()
+
     if args.manage:
         manage_commodity_mappings()
 
@@ -105,49 +105,53 @@ def seed_commodity_mappings_from_csv(csv_path: str = None, engine=None) -> bool:
                 )
                 NASS_SOURCE = "NASS_WEB"
 
+                # One round trip to learn which commodities already exist,
+                # instead of a SELECT per name — this path is network-bound,
+                # so N→1 queries is the whole win.
+                existing_result = conn.execute(text(
+                    "SELECT name FROM usda_commodity WHERE name = ANY(:names)"
+                ), {'names': unique_commodities['commodity_name'].tolist()})
+                existing_names = {r[0] for r in existing_result.fetchall()}
+
+                update_rows = []
+                insert_rows = []
                 for _, row in unique_commodities.iterrows():
-                    # First check if commodity already exists
-                    existing_result = conn.execute(text(
-                        "SELECT id FROM usda_commodity WHERE name = :name"
-                    ), {'name': row['commodity_name']})
-                    existing_row = existing_result.fetchone()
-
-                    if existing_row:
-                        # Update existing record — fill in metadata that may be NULL
-                        conn.execute(text("""
-                            UPDATE usda_commodity
-                            SET api_name    = :api_name,
-                                usda_code   = :usda_code,
-                                usda_source = COALESCE(usda_source, :usda_source),
-                                description = COALESCE(description, :description),
-                                uri         = COALESCE(uri, :uri),
-                                updated_at  = NOW()
-                            WHERE name = :name
-                        """), {
-                            'name': row['commodity_name'],
-                            'api_name': row['api_name'],
-                            'usda_code': int(row['usda_code']),
-                            'usda_source': NASS_SOURCE,
-                            'description': row['commodity_name'],
-                            'uri': NASS_URI,
-                        })
+                    params = {
+                        'name': row['commodity_name'],
+                        'api_name': row['api_name'],
+                        'usda_code': int(row['usda_code']),
+                        'usda_source': NASS_SOURCE,
+                        'description': row['commodity_name'],
+                        'uri': NASS_URI,
+                    }
+                    if row['commodity_name'] in existing_names:
+                        update_rows.append(params)
                     else:
-                        # Insert new record with full metadata
-                        conn.execute(text("""
-                            INSERT INTO usda_commodity
-                                (name, api_name, usda_code, usda_source, description, uri,
-                                 created_at, updated_at)
-                            VALUES
-                                (:name, :api_name, :usda_code, :usda_source, :description, :uri,
-                                 NOW(), NOW())
-                        """), {
-                            'name': row['commodity_name'],
-                            'api_name': row['api_name'],
-                            'usda_code': int(row['usda_code']),
-                            'usda_source': NASS_SOURCE,
-                            'description': row['commodity_name'],
-                            'uri': NASS_URI,
-                        })
+                        insert_rows.append(params)
+
+                if update_rows:
+                    # Update existing records — fill in metadata that may be NULL
+                    conn.execute(text("""
+                        UPDATE usda_commodity
+                        SET api_name    = :api_name,
+                            usda_code   = :usda_code,
+                            usda_source = COALESCE(usda_source, :usda_source),
+                            description = COALESCE(description, :description),
+                            uri         = COALESCE(uri, :uri),
+                            updated_at  = NOW()
+                        WHERE name = :name
+                    """), update_rows)
+
+                if insert_rows:
+                    # Insert new records with full metadata
+                    conn.execute(text("""
+                        INSERT INTO usda_commodity
+                            (name, api_name, usda_code, usda_source, description, uri,
+                             created_at, updated_at)
+                        VALUES
+                            (:name, :api_name, :usda_code, :usda_source, :description, :uri,
+                             NOW(), NOW())
+                    """), insert_rows)
 
                 print(f"✅ Seeded {len(unique_commodities)} USDA commodities")
 
@@ -323,11 +327,12 @@ def check_seeding_prerequisites(engine=None) -> dict:
             engine = get_engine()
 
         with engine.connect() as conn:
-            # Check resource table
-            resource_count = conn.execute(text("SELECT COUNT(*) FROM resource")).scalar()
-
-            # Check primary_ag_product table
-            primary_ag_count = conn.execute(text("SELECT COUNT(*) FROM primary_ag_product")).scalar()
+            # Both prerequisite counts in one round trip via scalar subqueries
+            resource_count, primary_ag_count = conn.execute(text("""
+                SELECT
+                    (SELECT COUNT(*) FROM resource) AS resource_count,
+                    (SELECT COUNT(*) FROM primary_ag_product) AS primary_ag_count
+            """)).one()
 
             return {
                 'resource_count': resource_count,
@@ -12,21 +12,65 @@ API Key Setup:
 2. Set environment variable: USDA_NASS_API_KEY=your_key_here
 """
 
+import atexit
+import logging
 import os
+import threading
 import requests
 import pandas as pd
 from typing import Optional, List
-import time
 from requests.adapters import HTTPAdapter
-from requests.packages.urllib3.util.retry import Retry
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
+
+logger = logging.getLogger(__name__)
 
 # Configuration
 BASE_URL = "https://quickstats.nass.usda.gov/api/api_GET"
 TIMEOUT = 30
 MAX_RETRIES = 3
-# Rate limiting: USDA API has implicit rate limits.
-# Being respectful: 1 second between requests
-REQUEST_DELAY = 1.0
+# QuickStats data for a given (state, year, commodity) key is effectively
+# read-only, so repeated runs can answer from disk instead of the network.
+CACHE_NAME = "usda_nass_cache"
+CACHE_EXPIRE_SECONDS = 86400  # 24h; long enough for a day's re-runs
+
+# The columns the extract diagnostics and the USDA transform actually read.
+# QuickStats returns ~40 per record; projecting down to these right after
+# construction keeps every later stage (concat, transform, load) narrow.
+REQUIRED_COLS = (
+    "source_desc",
+    "commodity_desc",
+    "short_desc",
+    "statisticcat_desc",
+    "unit_desc",
+    "freq_desc",
+    "reference_period_desc",
+    "begin_code",
+    "end_code",
+    "year",
+    "state_fips_code",
+    "county_code",
+    "county_name",
+    "Value",
+    "CV (%)",
+)
+
+# Process-wide session, built on first use. Sessions are thread-safe for
+# GETs, so the extract task's concurrent county fetches share one pool of
+# kept-alive connections instead of each call paying adapter construction
+# and a fresh TLS handshake. The lock keeps those concurrent first calls
+# from racing to initialize (same pattern as engine.get_engine).
+_SESSION = None
+_SESSION_LOCK = threading.Lock()
 
 
 def _get_session_with_retries():
@@ -41,19 +85,102 @@ def _get_session_with_retries():
     This respects NASS API terms by not hammering the endpoint.
 
     Returns:
-        requests.Session: Session with retry strategy configured
+        requests.Session: Shared session with retry strategy configured
+    """
+    global _SESSION
+    if _SESSION is not None:
+        return _SESSION
+
+    with _SESSION_LOCK:
+        if _SESSION is not None:
+            return _SESSION
+
+        try:
+            # Optional on-disk cache: identical queries within the TTL are
+            # answered from SQLite instead of re-hitting the API.
+            # CachedSession is a requests.Session subclass, so the retry
+            # adapter below still applies to cache misses.
+            import requests_cache
+            session = requests_cache.CachedSession(
+                CACHE_NAME,
+                backend="sqlite",
+                expire_after=CACHE_EXPIRE_SECONDS,
+                allowable_methods=["GET"],
+            )
+        except ImportError:
+            session = requests.Session()
+        retry_strategy = Retry(
+            total=MAX_RETRIES,
+            backoff_factor=1,  # Exponential backoff: 2^attempt seconds
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=["GET"]
+        )
+        # Pool sized above the default 10 so the concurrent per-county
+        # fetches reuse kept-alive connections instead of serializing on
+        # the pool or paying a fresh TLS handshake each.
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=16,
+            max_retries=retry_strategy,
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        # Ask for compressed JSON explicitly. QuickStats payloads are highly
+        # repetitive text, so gzip cuts bytes-on-wire by roughly an order of
+        # magnitude; requests decompresses transparently. Brotli is left out
+        # because decoding it needs an optional package we don't depend on.
+        session.headers.update({
+            "Accept": "application/json",
+            "Accept-Encoding": "gzip, deflate",
+        })
+        # The session outlives every caller; close its kept-alive
+        # connections when the process exits rather than leaking them.
+        atexit.register(session.close)
+        _SESSION = session
+    return _SESSION
+
+
+def _parse_json(response):
+    """
+    Decode a QuickStats response body.
+
+    Uses orjson when available — measurably faster than stdlib json on the
+    larger multi-commodity payloads — and falls back to response.json().
+    """
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+def _records_to_df(records: list) -> pd.DataFrame:
     """
-    session = requests.Session()
-    retry_strategy = Retry(
-        total=MAX_RETRIES,
-        backoff_factor=1,  # Exponential backoff: 2^attempt seconds
-        status_forcelist=[429, 500, 502, 503, 504],
-        allowed_methods=["GET"]
-    )
-    adapter = HTTPAdapter(max_retries=retry_strategy)
-    session.mount("http://", adapter)
-    session.mount("https://", adapter)
-    return session
+    Build a DataFrame from QuickStats response records column-by-column.
+
+    QuickStats rows are homogeneous dicts, so transposing them into column
+    lists first skips pandas' generic per-row normalizer and its type
+    sniffing — one pass over the rows instead of the dict-of-dicts slow path.
+
+    With pyarrow installed the transpose happens in Arrow's C++ reader
+    (Table.from_pylist), which writes straight into columnar buffers
+    instead of intermediate Python lists.
+    """
+    if pa is not None:
+        # ArrowDtype keeps the columns in Arrow buffers (offsets + packed
+        # UTF-8) instead of one Python str object per cell, and downstream
+        # .str kernels dispatch to Arrow's vectorized implementations.
+        df = pa.Table.from_pylist(records).to_pandas(types_mapper=pd.ArrowDtype)
+    else:
+        columns = {key: [record.get(key) for record in records]
+                   for key in records[0]}
+        df = pd.DataFrame(columns, copy=False)
+
+    # Keep only the columns the pipeline reads; the rest of the ~40-column
+    # QuickStats row would otherwise be carried through concat and transform
+    # just to be dropped at the schema rename.
+    keep = [col for col in REQUIRED_COLS if col in df.columns]
+    if keep:
+        df = df[keep]
+    return df
 
 
 def usda_nass_to_df(
@@ -79,7 +206,9 @@ def usda_nass_to_df(
     Args:
         api_key (str): Your USDA NASS API key
         state (str): State code (e.g., "CA"). Default: "CA"
-        year (Optional[int]): Filter by specific year. Default: None (all years)
+        year (Optional[int]): Filter by specific year, or a (start, end)
+                             sequence for a server-side year range.
+                             Default: None (all years)
         commodity (Optional[str]): Commodity name (e.g., "CORN", "ALMONDS")
         commodity_ids (Optional[List[str]]): USDA commodity names from database (e.g., ["CORN", "WHEAT"])
         county_code (Optional[str]): County FIPS code (e.g., "06077" for San Joaquin)
@@ -112,7 +241,7 @@ def usda_nass_to_df(
     """
 
     if not api_key:
-        print("Error: USDA_NASS_API_KEY is not set. Get a free key at https://quickstats.nass.usda.gov/api")
+        logger.error("USDA_NASS_API_KEY is not set. Get a free key at https://quickstats.nass.usda.gov/api")
         return None
 
     # Base parameters for all requests
@@ -122,8 +251,13 @@ def usda_nass_to_df(
         "format": "JSON",
     }
 
-    # Add optional filters
-    if year is not None:
+    # Add optional filters. A (start, end) pair becomes a server-side range
+    # filter, so multi-year pulls stay one request instead of the caller
+    # fetching the full historical series and trimming locally.
+    if isinstance(year, (list, tuple)) and year:
+        base_params["year__GE"] = min(year)
+        base_params["year__LE"] = max(year)
+    elif year is not None:
         base_params["year"] = year
     if county_code is not None:
         base_params["county_code"] = county_code
@@ -140,7 +274,7 @@ def usda_nass_to_df(
     base_params.update(kwargs)
 
     session = _get_session_with_retries()
-    all_dfs = []
+    result_df = None
     total_records_imported = 0
     query_log = []
 
@@ -148,70 +282,75 @@ def usda_nass_to_df(
         # Handle commodity_ids query (database-driven approach)
         if commodity_ids is not None:
             if not commodity_ids:
-                print("Warning: commodity_ids list is empty. No data to fetch.")
+                logger.warning("commodity_ids list is empty. No data to fetch.")
                 return pd.DataFrame()
 
-            print(f"Querying USDA API for {len(commodity_ids)} commodities...")
-
-            for idx, commodity_name in enumerate(commodity_ids, 1):
-                print(f"  [{idx}/{len(commodity_ids)}] Fetching commodity: {commodity_name}...")
+            logger.info("Querying USDA API for %d commodities in a single request...", len(commodity_ids))
 
-                # Create params for this commodity
-                params = base_params.copy()
-                params["commodity_desc"] = commodity_name
+            # The QuickStats API accepts repeated commodity_desc values as an
+            # OR filter, so one round trip replaces N sequential requests
+            # (each of which also paid a courtesy rate-limit sleep).
+            params = base_params.copy()
+            params["commodity_desc"] = list(commodity_ids)
 
-                try:
-                    response = session.get(BASE_URL, params=params, timeout=TIMEOUT)
-                    response.raise_for_status()
+            try:
+                response = session.get(BASE_URL, params=params, timeout=TIMEOUT)
+                response.raise_for_status()
 
-                    data = response.json()
+                data = _parse_json(response)
 
-                    # Check for API errors
-                    if isinstance(data, dict) and "error" in data:
-                        print(f"    USDA API Error: {data['error']}")
-                        continue
+                # Check for API errors
+                if isinstance(data, dict) and "error" in data:
+                    logger.error("USDA API Error: %s", data['error'])
+                    actual_data = []
+                # Extract actual data (USDA API returns {"data": [...]} not [...])
+                elif isinstance(data, dict) and "data" in data:
+                    actual_data = data["data"]
+                elif isinstance(data, list):
+                    actual_data = data
+                else:
+                    actual_data = []
 
-                    # Extract actual data (USDA API returns {"data": [...]} not [...])
-                    if isinstance(data, dict) and "data" in data:
-                        actual_data = data["data"]
-                    elif isinstance(data, list):
-                        actual_data = data
+                if len(actual_data) > 0:
+                    df = _records_to_df(actual_data)
+                    result_df = df
+                    total_records_imported += len(df)
+
+                    # Per-commodity accounting from the combined response, so the
+                    # query log keeps the same shape as the old one-call-per-commodity path
+                    if 'commodity_desc' in df.columns:
+                        counts = df['commodity_desc'].value_counts()
                     else:
-                        actual_data = []
-
-                    # Check if we have data (successful query)
-                    if len(actual_data) > 0:
-                        df = pd.DataFrame(actual_data)
-                        all_dfs.append(df)
-                        records_count = len(df)
-                        total_records_imported += records_count
+                        counts = {}
+                    for commodity_name in commodity_ids:
+                        records_count = int(counts.get(commodity_name, 0))
                         query_log.append({
                             'commodity_name': commodity_name,
                             'records': records_count,
                             'year': year,
-                            'status': 'success'
+                            'status': 'success' if records_count else 'no_data'
                         })
-                        print(f"    [OK] Retrieved {records_count} records for commodity {commodity_name}")
-                    else:
+                        if logger.isEnabledFor(logging.DEBUG):
+                            if records_count:
+                                logger.debug("Retrieved %d records for commodity %s", records_count, commodity_name)
+                            else:
+                                logger.debug("No data returned for commodity %s", commodity_name)
+                else:
+                    for commodity_name in commodity_ids:
                         query_log.append({
                             'commodity_name': commodity_name,
                             'records': 0,
                             'year': year,
                             'status': 'no_data'
                         })
-                        print(f"    No data returned for commodity {commodity_name}")
+                    logger.info("No data returned for requested commodities")
 
-                    # Rate limiting (NASS API courtesy)
-                    # Being respectful to avoid key suspension
-                    time.sleep(REQUEST_DELAY)
-
-                except requests.exceptions.RequestException as e:
-                    print(f"    Request failed for commodity {commodity_name}: {e}")
-                    continue
+            except requests.exceptions.RequestException as e:
+                logger.error("Request failed for commodities %s: %s", commodity_ids, e)
 
         # Handle commodity name query (fallback)
         elif commodity is not None:
-            print(f"Querying USDA API for commodity: {commodity}")
+            logger.info("Querying USDA API for commodity: %s", commodity)
             params = base_params.copy()
             params["commodity_desc"] = commodity
 
@@ -219,10 +358,10 @@ def usda_nass_to_df(
                 response = session.get(BASE_URL, params=params, timeout=TIMEOUT)
                 response.raise_for_status()
 
-                data = response.json()
+                data = _parse_json(response)
 
                 if isinstance(data, dict) and "error" in data:
-                    print(f"USDA API Error: {data['error']}")
+                    logger.error("USDA API Error: %s", data['error'])
                     return None
 
                 # Extract actual data (USDA API returns {"data": [...]} not [...])
@@ -234,27 +373,27 @@ def usda_nass_to_df(
                     actual_data = []
 
                 if len(actual_data) > 0:
-                    df = pd.DataFrame(actual_data)
-                    all_dfs.append(df)
-                    print(f"✓ Retrieved {len(df)} records for commodity {commodity}")
+                    df = _records_to_df(actual_data)
+                    result_df = df
+                    logger.info("Retrieved %d records for commodity %s", len(df), commodity)
                 else:
-                    print(f"No data returned for commodity {commodity}")
+                    logger.info("No data returned for commodity %s", commodity)
 
             except requests.exceptions.RequestException as e:
-                print(f"Request failed: {e}")
+                logger.error("Request failed: %s", e)
                 return None
 
         # Query all data (no commodity filter)
         else:
-            print("Querying USDA API for all commodities in state...")
+            logger.info("Querying USDA API for all commodities in state...")
             try:
                 response = session.get(BASE_URL, params=base_params, timeout=TIMEOUT)
                 response.raise_for_status()
 
-                data = response.json()
+                data = _parse_json(response)
 
                 if isinstance(data, dict) and "error" in data:
-                    print(f"USDA API Error: {data['error']}")
+                    logger.error("USDA API Error: %s", data['error'])
                     return None
 
                 # Extract actual data (USDA API returns {"data": [...]} not [...])
@@ -266,56 +405,44 @@ def usda_nass_to_df(
                     actual_data = []
 
                 if len(actual_data) > 0:
-                    df = pd.DataFrame(actual_data)
-                    all_dfs.append(df)
-                    print(f"✓ Retrieved {len(df)} total records")
+                    df = _records_to_df(actual_data)
+                    result_df = df
+                    logger.info("Retrieved %d total records", len(df))
                 else:
-                    print("No data returned from API")
+                    logger.info("No data returned from API")
 
             except requests.exceptions.RequestException as e:
-                print(f"Request failed: {e}")
+                logger.error("Request failed: %s", e)
                 return None
 
-        # Combine all DataFrames if multiple queries were made
-        if len(all_dfs) == 0:
-            print("No data retrieved from USDA API.")
+        # Each branch issues exactly one request, so there is at most one
+        # frame to return — no per-query accumulation or concat needed.
+        if result_df is None:
+            logger.info("No data retrieved from USDA API.")
             return pd.DataFrame()
 
-        if len(all_dfs) == 1:
-            result_df = all_dfs[0]
-        else:
-            result_df = pd.concat(all_dfs, ignore_index=True)
-            print(f"✓ Combined {len(all_dfs)} queries into {len(result_df)} total records")
-
-        # Add metadata for tracking
-        print("\n" + "="*60)
-        print("IMPORT SUMMARY")
-        print("="*60)
-        print(f"Total Records Imported: {total_records_imported}")
-        print(f"Parameters Used:")
-        print(f"  - State: {state}")
-        print(f"  - Year: {year if year else 'All'}")
-        print(f"  - Aggregation Level: {agg_level_desc}")
-        print(f"  - Domain: {domain_desc}")
-        if statisticcat_desc:
-            print(f"  - Statistic Category: {statisticcat_desc}")
-        if unit_desc:
-            print(f"  - Unit: {unit_desc}")
-        if county_code:
-            print(f"  - County Code: {county_code}")
-        print("="*60 + "\n")
+        logger.info(
+            "USDA import complete: %d records (state=%s, year=%s, agg_level=%s, domain=%s)",
+            total_records_imported, state, year if year else 'All',
+            agg_level_desc, domain_desc,
+        )
+        logger.debug(
+            "Optional filters: statisticcat=%s, unit=%s, county=%s",
+            statisticcat_desc, unit_desc, county_code,
+        )
 
         return result_df
 
     except Exception as e:
-        print(f"Unexpected error fetching USDA data: {e}")
+        logger.error("Unexpected error fetching USDA data: %s", e)
         return None
-    finally:
-        session.close()
 
 
 if __name__ == "__main__":
-    # Example usage for testing
+    # Example usage for testing. Logging is configured here, at the script
+    # entry point only — library callers keep their own handler setup.
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
     api_key = os.getenv("USDA_NASS_API_KEY", "")
 
     if not api_key:
@@ -0,0 +1,67 @@
+import csv
+import io
+from datetime import datetime
+from unittest.mock import MagicMock
+
+from ca_biositing.pipeline.etl.load.usda.usda_census_survey import _copy_observations
+
+# Mirrors the observation table columns the load path cares about.
+TABLE_COLUMNS = {
+    'id', 'record_id', 'record_type', 'parameter_id', 'unit_id', 'value',
+    'value_text', 'cv_pct', 'note', 'dataset_id', 'etl_run_id',
+    'lineage_group_id', 'created_at', 'updated_at',
+}
+
+
+def _observation_record():
+    now = datetime(2026, 1, 1, 12, 0, 0)
+    return {
+        'record_id': 1,
+        'record_type': 'usda_census_record',
+        'parameter_id': 2,
+        'unit_id': 3,
+        'value': 1234.0,
+        'value_text': '1,234',
+        'cv_pct': 2.5,
+        'note': 'USDA special code (D)',
+        'dataset_id': 4,
+        'etl_run_id': 5,
+        'lineage_group_id': 6,
+        'created_at': now,
+        'updated_at': now,
+    }
+
+
+def test_copy_observations_round_trips_optional_fields():
+    """The COPY path must carry the same fields as the small-batch insert.
+
+    The small-batch path inserts the obs_record dict directly, so the COPY
+    column list has to cover every key — including the optional value_text,
+    cv_pct and note fields — or large loads would silently drop them.
+    """
+    record = _observation_record()
+
+    engine = MagicMock()
+    raw = engine.raw_connection.return_value
+    cur = raw.cursor.return_value
+    captured = {}
+
+    def fake_copy_expert(sql, buf):
+        captured['sql'] = sql
+        captured['rows'] = list(csv.reader(io.StringIO(buf.read())))
+
+    cur.copy_expert.side_effect = fake_copy_expert
+    cur.rowcount = 1
+
+    inserted = _copy_observations(engine, [record], TABLE_COLUMNS)
+    assert inserted == 1
+
+    copy_cols = captured['sql'].split('(', 1)[1].split(')')[0].split(', ')
+    # Every key the small-batch pg_insert path would send is COPYed too.
+    assert set(copy_cols) == set(record)
+
+    row = dict(zip(copy_cols, captured['rows'][0]))
+    assert row['value_text'] == '1,234'
+    assert row['cv_pct'] == '2.5'
+    assert row['note'] == 'USDA special code (D)'
+    assert row['value'] == '1234.0'